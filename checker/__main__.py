@@ -76,14 +76,14 @@ def validate(
 
     print_info("Validating Exporter...")
     try:
-        exporter = Exporter(
+        with Exporter(
             course,
             checker_config.structure,
             checker_config.export,
             verbose=True,
             dry_run=True,
-        )
-        exporter.validate()
+        ) as exporter:
+            exporter.validate()
     except CheckerValidationError as e:
         print_info("Exporter Validation Failed", color="red")
         print_info(e)
@@ -124,7 +124,7 @@ def validate(
     "-p",
     "--parallelize",
     is_flag=True,
-    default=True,
+    default=False,
     help="Execute parallel checking of tasks",
 )
 @click.option(
@@ -134,7 +134,14 @@ def validate(
     default=os.cpu_count(),
     help="Num of processes parallel checking",
 )
+@click.option("--fail-fast", is_flag=True, help="Stop checking other tasks after the first failed one")
 @click.option("--no-clean", is_flag=True, help="Clean or not check tmp folders")
+@click.option(
+    "--tmp-dir",
+    type=ClickWritableDirectory,
+    default=None,
+    help="Directory to create check tmp folders in (system tmp by default)",
+)
 @click.option(
     "-v/-s",
     "--verbose/--silent",
@@ -152,7 +159,9 @@ def check(
     group: list[str] | None,
     parallelize: bool,
     num_processes: int,
+    fail_fast: bool,
     no_clean: bool,
+    tmp_dir: Path | None,
     verbose: bool,
     dry_run: bool,
 ) -> None:
@@ -177,52 +186,60 @@ def check(
     # read filesystem, check existing tasks
     course = Course(manytask_config, root)
 
-    # create exporter and export files for testing
-    exporter = Exporter(
+    # create exporter and export files for testing, temporary dir is removed on exit (if not no_clean)
+    with Exporter(
         course,
         checker_config.structure,
         checker_config.export,
         verbose=True,
         cleanup=not no_clean,
         dry_run=dry_run,
-    )
-    exporter.export_for_testing(exporter.temporary_dir)
-
-    # validate tasks and groups if passed
-    filesystem_tasks: dict[str, FileSystemTask] = dict()
-    if task:
-        for filesystem_task in course.get_tasks(enabled=True):
-            if filesystem_task.name in task:
-                filesystem_tasks[filesystem_task.name] = filesystem_task
-    if group:
-        for filesystem_group in course.get_groups(enabled=True):
-            if filesystem_group.name in group:
-                for filesystem_task in filesystem_group.tasks:
+        temporary_dir_root=tmp_dir,
+    ) as exporter:
+        exporter.export_for_testing(exporter.temporary_dir)
+
+        # validate tasks and groups if passed
+        filesystem_tasks: dict[str, FileSystemTask] = dict()
+        if task:
+            for filesystem_task in course.get_tasks(enabled=True):
+                if filesystem_task.name in task:
                     filesystem_tasks[filesystem_task.name] = filesystem_task
-    if filesystem_tasks:
-        print_info(f"Checking tasks: {', '.join(filesystem_tasks.keys())}")
-
-    # create tester to... to test =)
-    tester = Tester(course, checker_config, verbose=verbose, dry_run=dry_run)
-
-    # run tests
-    # TODO: progressbar on parallelize
-    try:
-        tester.run(
-            exporter.temporary_dir,
-            tasks=list(filesystem_tasks.values()) if filesystem_tasks else None,
-            report=False,
+        if group:
+            for filesystem_group in course.get_groups(enabled=True):
+                if filesystem_group.name in group:
+                    for filesystem_task in filesystem_group.tasks:
+                        filesystem_tasks[filesystem_task.name] = filesystem_task
+        if filesystem_tasks:
+            print_info(f"Checking tasks: {', '.join(filesystem_tasks.keys())}")
+
+        # create tester to... to test =)
+        tester = Tester(
+            course,
+            checker_config,
+            verbose=verbose,
+            dry_run=dry_run,
+            num_processes=num_processes if parallelize else 1,
+            fail_fast=fail_fast,
         )
-    except TestingError as e:
-        print_info("TESTING FAILED", color="red")
-        print_info(e)
-        exit(1)
-    except Exception as e:
-        print_info("UNEXPECTED ERROR", color="red")
-        print_info(e)
-        raise e
-        exit(1)
-    print_info("TESTING PASSED", color="green")
+
+        # run tests
+        # TODO: progressbar on parallelize
+        try:
+            tester.run(
+                exporter.temporary_dir,
+                tasks=list(filesystem_tasks.values()) if filesystem_tasks else None,
+                report=False,
+            )
+        except TestingError as e:
+            print_info("TESTING FAILED", color="red")
+            print_info(e)
+            exit(1)
+        except Exception as e:
+            print_info("UNEXPECTED ERROR", color="red")
+            print_info(e)
+            raise e
+            exit(1)
+        print_info("TESTING PASSED", color="green")
 
 
 @cli.command()
@@ -233,6 +250,12 @@ def check(
 @click.option("--username", type=str, default=None, help="Username to use for the submission")
 @click.option("--branch", type=str, default=None, help="Rewrite branch name for the submission")
 @click.option("--no-clean", is_flag=True, help="Clean or not check tmp folders")
+@click.option(
+    "--tmp-dir",
+    type=ClickWritableDirectory,
+    default=None,
+    help="Directory to create check tmp folders in (system tmp by default)",
+)
 @click.option(
     "-v/-s",
     "--verbose/--silent",
@@ -251,6 +274,7 @@ def grade(
     username: str | None,
     branch: str | None,
     no_clean: bool,
+    tmp_dir: Path | None,
     verbose: bool,
     dry_run: bool,
 ) -> None:
@@ -272,45 +296,46 @@ def grade(
     # read filesystem, check existing tasks
     course = Course(manytask_config, root, reference_root, branch_name=branch)
 
-    # create exporter and export files for testing
-    exporter = Exporter(
+    # create exporter and export files for testing, temporary dir is removed on exit (if not no_clean)
+    with Exporter(
         course,
         checker_config.structure,
         checker_config.export,
         verbose=False,
         cleanup=not no_clean,
         dry_run=dry_run,
-    )
-    exporter.export_for_testing(exporter.temporary_dir)
-
-    # detect changes to test
-    try:
-        changed_tasks = course.detect_changes(checker_config.testing.changes_detection)
-    except Exception as e:
-        print_info("DETECT CHANGES FAILED", color="red")
-        print_info(e)
-        exit(1)
-
-    # create tester to... to test =)
-    tester = Tester(course, checker_config, verbose=verbose, dry_run=dry_run)
-
-    # run tests
-    # TODO: progressbar on parallelize
-    try:
-        tester.run(
-            exporter.temporary_dir,
-            changed_tasks,
-            report=True,
-        )
-    except TestingError as e:
-        print_info("TESTING FAILED", color="red")
-        print_info(e)
-        exit(1)
-    except Exception as e:
-        print_info("UNEXPECTED ERROR", color="red")
-        print_info(e)
-        exit(1)
-    print_info("TESTING PASSED", color="green")
+        temporary_dir_root=tmp_dir,
+    ) as exporter:
+        exporter.export_for_testing(exporter.temporary_dir)
+
+        # detect changes to test
+        try:
+            changed_tasks = course.detect_changes(checker_config.testing.changes_detection)
+        except Exception as e:
+            print_info("DETECT CHANGES FAILED", color="red")
+            print_info(e)
+            exit(1)
+
+        # create tester to... to test =)
+        tester = Tester(course, checker_config, verbose=verbose, dry_run=dry_run)
+
+        # run tests
+        # TODO: progressbar on parallelize
+        try:
+            tester.run(
+                exporter.temporary_dir,
+                changed_tasks,
+                report=True,
+            )
+        except TestingError as e:
+            print_info("TESTING FAILED", color="red")
+            print_info(e)
+            exit(1)
+        except Exception as e:
+            print_info("UNEXPECTED ERROR", color="red")
+            print_info(e)
+            exit(1)
+        print_info("TESTING PASSED", color="green")
 
 
 @cli.command()
@@ -349,15 +374,15 @@ def export(
                 path.unlink()
 
     # create exporter and export files for public
-    exporter = Exporter(
+    with Exporter(
         course,
         checker_config.structure,
         checker_config.export,
         verbose=True,
         dry_run=dry_run,
-    )
-    export_root.mkdir(exist_ok=True, parents=True)
-    exporter.export_public(export_root, push=commit, commit_message=checker_config.export.commit_message)
+    ) as exporter:
+        export_root.mkdir(exist_ok=True, parents=True)
+        exporter.export_public(export_root, push=commit, commit_message=checker_config.export.commit_message)
 
 
 @cli.command(hidden=True)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 
@@ -16,12 +18,29 @@ class CustomBaseModel(pydantic.BaseModel):
 T = TypeVar("T", bound=pydantic.BaseModel)
 
 
+# libyaml based loader is much faster, but pyyaml can be built without it
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=256)
+def _load_yaml(path: str, mtime_ns: int, ctime_ns: int, size: int, inode: int) -> Any:
+    # the same configs are read several times per run (e.g. `check` validates first), so parse each file once
+    # Note: file stat is in the key, so changed or replaced (e.g. by git checkout) file is parsed again
+    # Note: in-place rewrite of the same size within one timestamp tick (coarse on some fs) is not detected
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlSafeLoader)
+
+
 class YamlLoaderMixin(Generic[T]):
     @classmethod
     def from_yaml(cls: type[T], path: Path) -> T:  # type: ignore[misc]
         try:
-            with path.open() as f:
-                return cls(**yaml.safe_load(f))
+            stat = path.stat()
+            # copy, as configs are mutable and should not share parsed data
+            data = copy.deepcopy(
+                _load_yaml(str(path.absolute()), stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+            )
+            return cls(**data)
         except FileNotFoundError:
             raise BadConfig(f"File {path} not found")
         except TypeError as e:
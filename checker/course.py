@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import warnings
 from collections.abc import Generator
 from dataclasses import dataclass
@@ -50,8 +51,12 @@ class Course:
         self.repository_root = repository_root
         self.reference_root = reference_root or repository_root
 
-        self.potential_groups = {group.name: group for group in self._search_for_groups_by_configs(self.reference_root)}
-        self.potential_tasks = {task.name: task for task in self._search_for_tasks_by_configs(self.reference_root)}
+        # walk and read tasks configs once, groups reuse already found tasks
+        tasks = list(self._search_for_tasks_by_configs(self.reference_root))
+        self.potential_groups = {
+            group.name: group for group in self._search_for_groups_by_configs(self.reference_root, tasks)
+        }
+        self.potential_tasks = {task.name: task for task in tasks}
 
         self.branch_name = branch_name
 
@@ -97,11 +102,21 @@ class Course:
             if deadline_task.name in self.potential_tasks
         ]
 
+    @staticmethod
+    def _search_for_config_files(
+        root: Path,
+        config_name: str,
+    ) -> Generator[Path, Any, None]:
+        # os.walk is scandir based, so it is cheaper than matching every path with `**` glob
+        for dir_path, _, file_names in os.walk(root):
+            if config_name in file_names:
+                yield Path(dir_path) / config_name
+
     @staticmethod
     def _search_for_tasks_by_configs(
         root: Path,
     ) -> Generator[FileSystemTask, Any, None]:
-        for task_config_path in root.glob(f"**/{Course.TASK_CONFIG_NAME}"):
+        for task_config_path in Course._search_for_config_files(root, Course.TASK_CONFIG_NAME):
             relative_task_path = task_config_path.parent.relative_to(root)
 
             # if empty file - use default
@@ -120,20 +135,34 @@ class Course:
     @staticmethod
     def _search_for_groups_by_configs(
         root: Path,
+        tasks: list[FileSystemTask] | None = None,
     ) -> Generator[FileSystemGroup, Any, None]:
-        for group_config_path in root.glob(f"**/{Course.GROUP_CONFIG_NAME}"):
+        """
+        Search for groups in the root folder.
+        :param root: folder to search groups in
+        :param tasks: tasks already found in the same root, to pick group tasks from instead of searching again
+        """
+        for group_config_path in Course._search_for_config_files(root, Course.GROUP_CONFIG_NAME):
             relative_group_path = group_config_path.parent.relative_to(root)
 
             # if empty file - use default
-            if group_config_path.read_text().strip() == "" or group_config_path.read_text().strip() == "\n":
+            if group_config_path.read_text().strip() == "":
                 group_config = CheckerSubConfig.default()
             # if any content - read yml
             else:
                 group_config = CheckerSubConfig.from_yaml(group_config_path)
 
-            group_tasks = list(Course._search_for_tasks_by_configs(group_config_path.parent))
-            for task in group_tasks:
-                task.relative_path = str(relative_group_path / task.relative_path)
+            if tasks is not None:
+                group_tasks = [
+                    task
+                    for task in tasks
+                    if relative_group_path == Path(task.relative_path)
+                    or relative_group_path in Path(task.relative_path).parents
+                ]
+            else:
+                group_tasks = list(Course._search_for_tasks_by_configs(group_config_path.parent))
+                for task in group_tasks:
+                    task.relative_path = str(relative_group_path / task.relative_path)
 
             yield FileSystemGroup(
                 name=group_config_path.parent.name,
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import fnmatch
+import mmap
+import os
 import re
 import shutil
 import tempfile
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Any
 
 from checker.configs import CheckerExportConfig, CheckerStructureConfig
 from checker.course import Course
@@ -11,6 +16,37 @@ from checker.exceptions import BadStructure
 from checker.utils import print_info
 
 
+@lru_cache(maxsize=None)
+def _compile_path_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str] | None, tuple[str, ...]]:
+    """
+    Join patterns matching a file name only (e.g. `*.pyc`) in a single regexp, to match each path once.
+    :param patterns: `Path.match` patterns
+    :return: regexp of joined name patterns or None if no such patterns, and the rest of patterns
+    """
+    name_patterns, other_patterns = [], []
+    for pattern in patterns:
+        pattern_parts = PurePath(pattern).parts
+        # single relative part is matched against the last path part only, as `Path.match` does
+        if len(pattern_parts) == 1 and not PurePath(pattern).anchor:
+            name_patterns.append(pattern_parts[0])
+        else:
+            other_patterns.append(pattern)
+    if not name_patterns:
+        return None, tuple(other_patterns)
+    # path names are matched case-insensitively where the filesystem paths are (windows)
+    flags = 0 if os.path.normcase("A") == "A" else re.IGNORECASE
+    names_regexp = re.compile("|".join(fnmatch.translate(pattern) for pattern in name_patterns), flags)
+    return names_regexp, tuple(other_patterns)
+
+
+def _match_any_pattern(path: Path, patterns: list[str]) -> bool:
+    """Same as `any(path.match(pattern) for pattern in patterns)`, but file name patterns are checked at once"""
+    names_regexp, other_patterns = _compile_path_patterns(tuple(patterns))
+    if names_regexp is not None and names_regexp.match(path.name):
+        return True
+    return any(path.match(pattern) for pattern in other_patterns)
+
+
 class Exporter:
     """
     The Exporter class is responsible for moving course files.
@@ -33,6 +69,7 @@ class Exporter:
         cleanup: bool = True,
         verbose: bool = False,
         dry_run: bool = False,
+        temporary_dir_root: Path | None = None,
     ) -> None:
         self.course = course
 
@@ -42,8 +79,16 @@ class Exporter:
         self.repository_root = course.repository_root
         self.reference_root = course.reference_root
 
-        self._temporary_dir_manager = tempfile.TemporaryDirectory()
-        self.temporary_dir = Path(self._temporary_dir_manager.name)
+        # unique temporary dir, optionally inside persistent root (e.g. tmpfs or dir with build caches)
+        # removed on exit from the exporter context if `cleanup`, otherwise kept to inspect after the check
+        if temporary_dir_root is not None:
+            temporary_dir_root.mkdir(parents=True, exist_ok=True)
+        self._temporary_dir_manager: tempfile.TemporaryDirectory[str] | None = None
+        if cleanup:
+            self._temporary_dir_manager = tempfile.TemporaryDirectory(dir=temporary_dir_root)
+            self.temporary_dir = Path(self._temporary_dir_manager.name)
+        else:
+            self.temporary_dir = Path(tempfile.mkdtemp(dir=temporary_dir_root))
 
         self.sub_config_files = {}
         for group in self.course.get_groups(enabled=True):
@@ -171,34 +216,40 @@ class Exporter:
         """Search for files/folder should be ignored due to templating in the current directory only"""
         exclude_paths = []
 
+        # list directory once for both template types, instead of globbing it for each
+        # Note: scandir entries cache file type, so no extra stat calls for is_dir checks
+        with os.scandir(root) as root_entries_iterator:
+            root_entries = list(root_entries_iterator)
+
         if (
             self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH
             or self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH_OR_CREATE
         ):
-            for template_file_or_folder in root.glob(f"*{self.TEMPLATE_SUFFIX}"):
+            for template_file_or_folder in root_entries:
+                if not template_file_or_folder.name.endswith(self.TEMPLATE_SUFFIX):
+                    continue
                 if ignore_templates:
                     exclude_paths.append(template_file_or_folder.name)
                 else:
-                    exclude_paths.append(template_file_or_folder.stem)
+                    exclude_paths.append(Path(template_file_or_folder.name).stem)
 
         if (
             self.export_config.templates == CheckerExportConfig.TemplateType.CREATE
             or self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH_OR_CREATE
         ):
             # if got empty file after template comments deletion - exclude it
-            for potential_comments_file in root.glob("*"):
+            for potential_comments_file in root_entries:
                 if potential_comments_file.is_dir():
                     continue
                 try:
-                    open(potential_comments_file, "r").read()
+                    with open(potential_comments_file.path) as f:
+                        file_content = f.read().strip()
                 except UnicodeDecodeError:
                     continue
-                with potential_comments_file.open("r") as f:
-                    file_content = f.read().strip()
-                    if file_content.startswith(self.TEMPLATE_START_COMMENT) and file_content.endswith(
-                        self.TEMPLATE_END_COMMENT
-                    ):
-                        exclude_paths.append(potential_comments_file.name)
+                if file_content.startswith(self.TEMPLATE_START_COMMENT) and file_content.endswith(
+                    self.TEMPLATE_END_COMMENT
+                ):
+                    exclude_paths.append(potential_comments_file.name)
 
         return exclude_paths
 
@@ -334,55 +385,51 @@ class Exporter:
                 return
 
         # select paths to ignore - original to replace or templates to ignore
-        exclude_paths = self._search_for_exclude_due_to_templates(root, not fill_templates)
+        exclude_paths = set(self._search_for_exclude_due_to_templates(root, not fill_templates))
+
+        # templates mode is the same for all files, check it once
+        search_template_files = (
+            self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH
+            or self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH_OR_CREATE
+        )
+        create_templates_from_comments = (
+            self.export_config.templates == CheckerExportConfig.TemplateType.CREATE
+            or self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH_OR_CREATE
+        )
 
         # Iterate over all files in the root directory
-        for path in root.iterdir():
-            path_destination = destination / path.relative_to(root)
-            # check if byte file
-            is_text_file = False
-            try:
-                if path.is_file():
-                    open(path, "r").read()
-                    is_text_file = True
-            except UnicodeDecodeError:
-                pass
+        # Note: scandir entries cache file type, so no extra stat calls for is_dir/is_file checks
+        with os.scandir(root) as root_entries_iterator:
+            root_entries = list(root_entries_iterator)
+        for entry in root_entries:
+            path = Path(entry.path)
+            is_dir, is_file = entry.is_dir(), entry.is_file()
+            # `scandir` yields direct children, so the name is the path relative to the root
+            path_destination = destination / path.name
+            path_relative = path.relative_to(global_root)
             # check if file template
-            is_path_template_file = (
-                self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH
-                or self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH_OR_CREATE
-            ) and path.name.endswith(self.TEMPLATE_SUFFIX)
-            is_path_template_comment = (
-                is_text_file
-                and (
-                    self.export_config.templates == CheckerExportConfig.TemplateType.CREATE
-                    or self.export_config.templates == CheckerExportConfig.TemplateType.SEARCH_OR_CREATE
-                )
-                and not path.is_dir()
-                and self.TEMPLATE_START_COMMENT in path.read_text()
-                and self.TEMPLATE_END_COMMENT in path.read_text()
-            )
+            is_path_template_file = search_template_files and path.name.endswith(self.TEMPLATE_SUFFIX)
 
             # if will replace with template - ignore file
             if path.name in exclude_paths:
                 if self.verbose:
-                    print_info(f"    - Skip <{path.relative_to(global_root)}> because of templating", color="grey")
+                    print_info(f"    - Skip <{path_relative}> because of templating", color="grey")
                 continue
 
             # ignore if match ignore patterns
-            if config.ignore_patterns and any(path.match(ignore_pattern) for ignore_pattern in config.ignore_patterns):
+            if config.ignore_patterns and _match_any_pattern(path, config.ignore_patterns):
                 if self.verbose:
-                    print_info(f"    - Skip <{path.relative_to(global_root)}> because of ignore patterns", color="grey")
+                    print_info(f"    - Skip <{path_relative}> because of ignore patterns", color="grey")
                 continue
 
             # If matches public patterns AND copy_public is False - skip
             is_public = False
-            if config.public_patterns and any(path.match(public_pattern) for public_pattern in config.public_patterns):
+            if config.public_patterns and _match_any_pattern(path, config.public_patterns):
                 is_public = True
                 if not copy_public:
                     if self.verbose:
                         print_info(
-                            f"    - Skip <{path.relative_to(global_root)}> because of public patterns skip",
+                            f"    - Skip <{path_relative}> because of public patterns skip",
                             color="grey",
                         )
                     continue
@@ -390,57 +437,53 @@ class Exporter:
             # If matches private patterns AND copy_private is False - skip
             # If it is public file - never consider it as private
             is_private = False
-            if (
-                not is_public
-                and config.private_patterns
-                and any(path.match(private_pattern) for private_pattern in config.private_patterns)
-            ):
+            if not is_public and config.private_patterns and _match_any_pattern(path, config.private_patterns):
                 is_private = True
                 if not copy_private:
                     if self.verbose:
                         print_info(
-                            f"    - Skip <{path.relative_to(global_root)}> because of skip private patterns skip",
+                            f"    - Skip <{path_relative}> because of skip private patterns skip",
                             color="grey",
                         )
                     continue
 
             # if not match public and not match private and copy_other is False - skip
             # Note: never skip "other" directories, look inside them first
-            if not is_public and not is_private and not path.is_dir():
+            if not is_public and not is_private and not is_dir:
                 if not copy_other:
                     if self.verbose:
                         print_info(
-                            f"    - Skip <{path.relative_to(global_root)}> because of copy other files not enabled",
+                            f"    - Skip <{path_relative}> because of copy other files not enabled",
                             color="grey",
                         )
                     continue
 
             # if file is empty file/folder - just do not copy (delete original file due to exclude_paths)
             if fill_templates and is_path_template_file:
-                if path.is_dir() and not any((path_destination / file).exists() for file in path.iterdir()):
+                if is_dir and not any((path_destination / file).exists() for file in path.iterdir()):
                     if self.verbose:
                         print_info(
-                            f"    - Skip <{path.relative_to(global_root)}> because it is empty folder and "
+                            f"    - Skip <{path_relative}> because it is empty folder and "
                             f"templating is set to {self.export_config.templates}",
                             color="grey",
                         )
                     continue
-                if path.is_file() and path.stat().st_size == 0:
+                if is_file and entry.stat().st_size == 0:
                     if self.verbose:
                         print_info(
-                            f"    - Skip <{path.relative_to(global_root)}> because it is empty file and "
+                            f"    - Skip <{path_relative}> because it is empty file and "
                             f"templating is set to {self.export_config.templates}",
                             color="grey",
                         )
                     continue
 
             # If the file is a directory, recursively call this function
-            if path.is_dir():
+            if is_dir:
                 # if folder public or private - just copy it
                 if is_public or is_private:
                     if self.verbose:
                         print_info(
-                            f"    - Fully Copy <{path.relative_to(global_root)}> to "
+                            f"    - Fully Copy <{path_relative}> to "
                             f"<{path_destination.relative_to(global_destination)}>",
                             color="grey",
                         )
@@ -463,8 +506,8 @@ class Exporter:
                     path_destination = path_destination.parent / path_destination.stem
 
                 # If have sub-config - update config with sub-config
-                if path.relative_to(global_root) in self.sub_config_files:
-                    declared_sub_config = self.sub_config_files[path.relative_to(global_root)]
+                if path_relative in self.sub_config_files:
+                    declared_sub_config = self.sub_config_files[path_relative]
                     sub_config = CheckerStructureConfig(
                         ignore_patterns=declared_sub_config.ignore_patterns
                         if declared_sub_config.ignore_patterns is not None
@@ -482,7 +525,7 @@ class Exporter:
                 # Recursively call this function
                 if self.verbose:
                     print_info(
-                        f"    -- Recursively copy from <{path.relative_to(global_root)}> to "
+                        f"    -- Recursively copy from <{path_relative}> to "
                         f"<{path_destination.relative_to(global_destination)}>",
                         color="grey",
                     )
@@ -502,8 +545,7 @@ class Exporter:
             else:
                 if self.verbose:
                     print_info(
-                        f"    - Copy <{path.relative_to(global_root)}> to "
-                        f"<{path_destination.relative_to(global_destination)}>",
+                        f"    - Copy <{path_relative}> to <{path_destination.relative_to(global_destination)}>",
                         color="grey",
                     )
                 path_destination.parent.mkdir(parents=True, exist_ok=True)
@@ -512,19 +554,71 @@ class Exporter:
                 if fill_templates and is_path_template_file:
                     path_destination = path_destination.parent / path_destination.stem
 
+                # read only files actually copied and only if comments can be filled, others are copied as is
+                # Note: most files have no comments, check raw bytes first and decode only files with them
+                file_content: str | None = None
+                if fill_templates and create_templates_from_comments and self._has_template_comments(path):
+                    try:
+                        file_content = path.read_text()
+                    except UnicodeDecodeError:
+                        # binary file, can not have template comments
+                        pass
+
                 # if template comments in file - replace them, not greedy
-                if fill_templates and is_path_template_comment:
-                    with path.open("r") as f:
-                        file_content = f.read()
+                if (
+                    file_content is not None
+                    and self.TEMPLATE_START_COMMENT in file_content
+                    and self.TEMPLATE_END_COMMENT in file_content
+                ):
                     file_content = self.TEMPLATE_COMMENT_REGEX.sub(self.TEMPLATE_REPLACE_COMMENT, file_content)
-                    path_destination.touch(exist_ok=True)
                     path_destination.write_text(file_content)
                 else:
-                    shutil.copyfile(
-                        path,
-                        path_destination,
-                    )
+                    self._copy_file(path, path_destination)
+
+    @classmethod
+    def _has_template_comments(cls, path: Path) -> bool:
+        """
+        Check if the file has both template comments, without reading it in memory.
+        :param path: file to check
+        """
+        with path.open("rb") as f:
+            # empty file can not be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as file_content:
+                return (
+                    file_content.find(cls.TEMPLATE_START_COMMENT.encode()) != -1
+                    and file_content.find(cls.TEMPLATE_END_COMMENT.encode()) != -1
+                )
+
+    @staticmethod
+    def _copy_file(source: Path, destination: Path) -> None:
+        """
+        Copy file content as `shutil.copyfile` does, but in-kernel with `os.copy_file_range` where available.
+        It lets copy-on-write filesystems (btrfs, xfs) share the blocks (reflink) instead of copying bytes.
+        :param source: file to copy
+        :param destination: file to create or overwrite
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                with source.open("rb") as source_file, destination.open("wb") as destination_file:
+                    bytes_left = os.fstat(source_file.fileno()).st_size
+                    while bytes_left > 0:
+                        bytes_copied = os.copy_file_range(source_file.fileno(), destination_file.fileno(), bytes_left)
+                        if bytes_copied == 0:
+                            # some filesystems report nothing copied instead of an error, copy as usual
+                            break
+                        bytes_left -= bytes_copied
+                if bytes_left == 0:
+                    return
+            except OSError:
+                # not supported by the kernel or filesystem (e.g. cross-device on old kernels), copy as usual
+                pass
+        shutil.copyfile(source, destination)
+
+    def __enter__(self) -> Exporter:
+        return self
 
-    def __del__(self) -> None:
-        if self.__dict__.get("cleanup") and self._temporary_dir_manager:
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._temporary_dir_manager:
             self._temporary_dir_manager.cleanup()
@@ -9,10 +9,10 @@ import jinja2.nativetypes
 from .configs import PipelineStageConfig
 from .exceptions import BadConfig, PluginExecutionFailed
 from .plugins import PluginABC
-from .utils import print_info
+from .utils import DATACLASS_SLOTS, print_info
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PipelineStageResult:
     """Result of a single pipeline stage.
     :param name: name of the stage
@@ -37,7 +37,7 @@ class PipelineStageResult:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PipelineResult:
     failed: bool
     stage_results: list[PipelineStageResult]
@@ -58,6 +58,8 @@ class ParametersResolver:
             variable_start_string="${{",
             variable_end_string="}}",
         )
+        # pipeline args are the same for every task, so compile each template string only once
+        self._compiled_templates: dict[str, jinja2.Template] = {}
 
     def resolve(self, template: str | list[str] | Any, context: dict[str, Any]) -> Any:
         """
@@ -73,7 +75,10 @@ class ParametersResolver:
         """
         if isinstance(template, str):
             try:
-                template_obj = self.template_env.from_string(template.strip())
+                template_obj = self._compiled_templates.get(template)
+                if template_obj is None:
+                    template_obj = self.template_env.from_string(template.strip())
+                    self._compiled_templates[template] = template_obj
                 return template_obj.render(**context)
             except jinja2.TemplateError as e:
                 raise BadConfig(f"Invalid template {template}") from e
@@ -109,8 +114,16 @@ class PipelineRunner:
 
         self.parameters_resolver = ParametersResolver()
 
+        # (plugin name, resolved args repr) already validated, as the same args are often resolved for each task
+        self._validated_args: set[tuple[str, str]] = set()
+
         self.validate({}, validate_placeholders=False)
 
+        # plugins are stateless, so create each used plugin once and reuse it on every run
+        self._plugin_instances = {
+            pipeline_stage.run: self.plugins[pipeline_stage.run]() for pipeline_stage in self.pipeline
+        }
+
     def __len__(self) -> int:
         return len(self.pipeline)
 
@@ -134,7 +147,10 @@ class PipelineRunner:
             # validate args of the plugin (first resolve placeholders)
             if validate_placeholders:
                 resolved_args = self.parameters_resolver.resolve(pipeline_stage.args, context)
-                plugin_class.validate(resolved_args)
+                validated_args_key = (pipeline_stage.run, repr(resolved_args))
+                if validated_args_key not in self._validated_args:
+                    plugin_class.validate(resolved_args)
+                    self._validated_args.add(validated_args_key)
 
             # validate run_if condition
             if validate_placeholders and pipeline_stage.run_if:
@@ -210,8 +226,7 @@ class PipelineRunner:
                     continue
 
             # select the plugin to run
-            plugin_class = self.plugins[pipeline_stage.run]
-            plugin = plugin_class()
+            plugin = self._plugin_instances[pipeline_stage.run]
 
             # skip if dry run
             if dry_run:
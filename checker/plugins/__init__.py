@@ -23,6 +23,10 @@ def get_all_subclasses(cls: type[PluginABC]) -> set[type[PluginABC]]:
     return set(cls.__subclasses__()).union([s for c in cls.__subclasses__() for s in get_all_subclasses(c)])
 
 
+# plugins loaded for the search directories, as loading executes all plugins modules again
+_loaded_plugins_cache: dict[tuple[str, ...], dict[str, type[PluginABC]]] = {}
+
+
 def load_plugins(
     search_directories: Sequence[str | Path] | None = None,
     *,
@@ -39,6 +43,12 @@ def load_plugins(
         *search_directories,
     ]  # add local plugins first
 
+    cache_key = tuple(str(Path(path).absolute()) for path in search_directories)
+    if cache_key in _loaded_plugins_cache:
+        if verbose:
+            print_info(f"Loaded (cached): {', '.join(_loaded_plugins_cache[cache_key].keys())}")
+        return dict(_loaded_plugins_cache[cache_key])
+
     # force load plugins
     print_info("Loading plugins...")
     for module_info in pkgutil.iter_modules([str(path) for path in search_directories]):
@@ -63,4 +73,5 @@ def load_plugins(
         plugins[subclass.name] = subclass
     if verbose:
         print_info(f"Loaded: {', '.join(plugins.keys())}")
-    return plugins
+    _loaded_plugins_cache[cache_key] = plugins
+    return dict(plugins)
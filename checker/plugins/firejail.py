@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
+
+from pydantic import NonNegativeInt
 
 from ..exceptions import PluginExecutionFailed
 from .base import PluginOutput
@@ -30,18 +32,24 @@ class SafeRunScriptPlugin(PluginABC):
         paths_whitelist: list[str] = list()
         lock_network: bool = True
         allow_fallback: bool = False
+        max_output_size: Optional[NonNegativeInt] = None  # keep only last bytes of the output, keep all if None
 
     def _run(self, args: Args, *, verbose: bool = False) -> PluginOutput:  # type: ignore[override]
         import subprocess
 
         # test if firejail script is available
         # TODO: test fallback
-        result = subprocess.run(["firejail", "--version"], capture_output=True)
+        # only stderr is reported on failure, so do not capture (and decode) the version output
+        result = subprocess.run(["firejail", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         if result.returncode != 0:
             if args.allow_fallback:
                 # fallback to RunScriptPlugin
                 run_args = RunScriptPlugin.Args(
-                    origin=args.origin, script=args.script, timeout=args.timeout, env_whitelist=args.env_whitelist
+                    origin=args.origin,
+                    script=args.script,
+                    timeout=args.timeout,
+                    env_whitelist=args.env_whitelist,
+                    max_output_size=args.max_output_size,
                 )
                 output = RunScriptPlugin()._run(args=run_args, verbose=verbose)
                 if verbose:
@@ -88,6 +96,10 @@ class SafeRunScriptPlugin(PluginABC):
 
         # Will use RunScriptPlugin to run Firejail+command
         run_args = RunScriptPlugin.Args(
-            origin=args.origin, script=run_command, timeout=args.timeout, env_whitelist=None
+            origin=args.origin,
+            script=run_command,
+            timeout=args.timeout,
+            env_whitelist=None,
+            max_output_size=args.max_output_size,
         )
         return RunScriptPlugin()._run(args=run_args, verbose=verbose)
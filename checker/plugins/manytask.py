@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import IO, Any, Optional
@@ -23,6 +24,10 @@ class ManytaskPlugin(PluginABC):
 
     name = "report_score_manytask"
 
+    # one session for all reports, so connections to manytask are reused (tasks can be reported in parallel threads)
+    _session: requests.Session | None = None
+    _session_lock = threading.Lock()
+
     class Args(PluginABC.Args):
         origin: Optional[str] = None  # as pydantic does not support | in older python versions
         patterns: list[str] = ["*"]
@@ -58,7 +63,12 @@ class ManytaskPlugin(PluginABC):
         if verbose:
             output.append(str(files))
 
-        response = self._post_with_retries(args.report_url, data, files)
+        try:
+            response = self._post_with_retries(args.report_url, data, files)
+        finally:
+            # do not keep file descriptors open after the upload, tasks can be reported in parallel
+            for _, file in (files or {}).values():
+                file.close()
 
         try:
             result = response.json()
@@ -70,18 +80,36 @@ class ManytaskPlugin(PluginABC):
         except (json.JSONDecodeError, KeyError):
             raise PluginExecutionFailed("Unable to decode response")
 
-    @staticmethod
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        with cls._session_lock:
+            if cls._session is None:
+                # jitter spreads retries of reports sent at the same time (e.g. by many CI jobs) apart
+                # Note: POST is retried as well, report of the same score can be safely sent again
+                retry_strategy = urllib3.Retry(
+                    total=3,
+                    backoff_factor=1,
+                    backoff_jitter=1,
+                    status_forcelist=[408, 500, 502, 503, 504],
+                    allowed_methods=urllib3.Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+                    raise_on_status=False,  # return the last response to report its status code
+                )
+                # pool size is enough for reports of all tasks running in parallel
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=32, max_retries=retry_strategy)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls._session = session
+            return cls._session
+
+    @classmethod
     def _post_with_retries(
+        cls,
         report_url: AnyUrl,
         data: dict[str, Any],
         files: dict[str, tuple[str, IO[bytes]]] | None,
     ) -> requests.Response:
-        retry_strategy = urllib3.Retry(total=3, backoff_factor=1, status_forcelist=[408, 500, 502, 503, 504])
-        adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
-        session = requests.Session()
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        response = session.post(url=f"{report_url}api/report", data=data, files=files)
+        response = cls._get_session().post(url=f"{report_url}api/report", data=data, files=files)
 
         if response.status_code >= 400:
             raise PluginExecutionFailed(f"{response.status_code}: {response.text}")
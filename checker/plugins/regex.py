@@ -1,9 +1,34 @@
 from __future__ import annotations
 
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import field_validator
+
 from ..exceptions import PluginExecutionFailed
 from .base import PluginABC, PluginOutput
 
 
+# characters with special meaning in regexps (with re.MULTILINE), regexps without them are plain strings
+# Note: newlines are here as well, as they are normalized in text read only
+_REGEXP_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]()|\\\r\n")
+
+
+@lru_cache(maxsize=None)
+def _compile_regexp(regexp: str) -> re.Pattern[str]:
+    # same regexps are checked for every task, and validated before, so compile each once
+    return re.compile(regexp, re.MULTILINE)
+
+
+def _is_plain_string(regexp: str) -> bool:
+    return _REGEXP_SPECIAL_CHARACTERS.isdisjoint(regexp)
+
+
 class CheckRegexpsPlugin(PluginABC):
     """Plugin for checking forbidden regexps in a files."""
 
@@ -13,13 +38,20 @@ class CheckRegexpsPlugin(PluginABC):
         origin: str
         patterns: list[str]
         regexps: list[str]
-        # TODO: Add validation for patterns and regexps
+        # TODO: Add validation for patterns
+
+        @field_validator("regexps")
+        @classmethod
+        def check_regexps(cls, data: list[str]) -> list[str]:
+            for regexp in data:
+                try:
+                    _compile_regexp(regexp)
+                except re.error as e:
+                    raise ValueError(f"Invalid regexp '{regexp}': {e}")
+            return data
 
     def _run(self, args: Args, *, verbose: bool = False) -> PluginOutput:  # type: ignore[override]
         # TODO: add verbose output with files list
-        import re
-        from pathlib import Path
-
         # TODO: move to Args validation
         if not Path(args.origin).exists():
             raise PluginExecutionFailed(
@@ -27,18 +59,67 @@ class CheckRegexpsPlugin(PluginABC):
                 output=f"Origin {args.origin} does not exist",
             )
 
-        for pattern in args.patterns:
-            for file in Path(args.origin).glob(pattern):
-                if file.is_file():
-                    with file.open() as f:
-                        file_content = f.read()
-
-                    for regexp in args.regexps:
-                        if re.search(regexp, file_content, re.MULTILINE):
-                            raise PluginExecutionFailed(
-                                f"File '{file.name}' matches regexp '{regexp}'",
-                                output=f"File '{file}' matches regexp '{regexp}'",
-                            )
+        if not args.regexps:
+            return PluginOutput(
+                output="No forbidden regexps to check",
+            )
+
+        # collect files first, so file matched by several patterns (e.g. `*` and `*.py`) is checked once
+        files = dict.fromkeys(
+            file for pattern in args.patterns for file in Path(args.origin).glob(pattern) if file.is_file()
+        )
+
+        for file in files:
+            matched_regexp = self._find_matched_regexp(file, args.regexps)
+            if matched_regexp is not None:
+                raise PluginExecutionFailed(
+                    f"File '{file.name}' matches regexp '{matched_regexp}'",
+                    output=f"File '{file}' matches regexp '{matched_regexp}'",
+                )
         return PluginOutput(
             output="No forbidden regexps found",
         )
+
+    @staticmethod
+    @contextmanager
+    def _map_file(file: Path) -> Iterator[bytes | mmap.mmap]:
+        """
+        Map file content in memory, so it is searched right in the page cache without reading it.
+        :param file: file to map
+        """
+        with file.open("rb") as f:
+            # empty file can not be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as file_content:
+                # content is scanned front to back, let the kernel read ahead (not available on all platforms)
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    file_content.madvise(mmap.MADV_SEQUENTIAL)
+                yield file_content
+
+    @classmethod
+    def _find_matched_regexp(cls, file: Path, regexps: list[str]) -> str | None:
+        """
+        Find the first of regexps matching the file content.
+        :param file: file to search in
+        :param regexps: regexps to search for, in order
+        :return: first matched regexp or None if nothing found
+        """
+        # map file only if all regexps are plain strings (e.g. `import os`), search them as bytes in page cache
+        # otherwise the text is read anyway, so search plain strings in it as well
+        if all(_is_plain_string(regexp) for regexp in regexps):
+            with cls._map_file(file) as mapped_content:
+                for regexp in regexps:
+                    if mapped_content.find(regexp.encode()) != -1:
+                        return regexp
+            return None
+
+        text_content = file.read_text()
+        for regexp in regexps:
+            if _is_plain_string(regexp):
+                if regexp in text_content:
+                    return regexp
+            elif _compile_regexp(regexp).search(text_content):
+                return regexp
+        return None
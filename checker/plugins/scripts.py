@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import os
+import selectors
+import subprocess
+import time
+from collections import deque
 from typing import Optional, Union
 
+from pydantic import NonNegativeInt
+
 from ..exceptions import PluginExecutionFailed
 from .base import PluginABC, PluginOutput
 
@@ -11,25 +18,19 @@ class RunScriptPlugin(PluginABC):
 
     name = "run_script"
 
+    OUTPUT_READ_CHUNK_SIZE = 64 * 1024
+
     class Args(PluginABC.Args):
         origin: str
         script: Union[str, list[str]]  # as pydantic does not support | in older python versions
         timeout: Union[float, None] = None  # as pydantic does not support | in older python versions
         env_whitelist: Optional[list[str]] = None
+        max_output_size: Optional[NonNegativeInt] = None  # keep only last bytes of the output, keep all if None
 
     def _run(self, args: Args, *, verbose: bool = False) -> PluginOutput:  # type: ignore[override]
-        import subprocess
-
-        def set_up_env_sandbox() -> None:  # pragma: nocover
-            import os
-
-            if args.env_whitelist is None:
-                return
-
-            env = os.environ.copy()
-            os.environ.clear()
-            for variable in args.env_whitelist:
-                os.environ[variable] = env[variable]
+        # pass only whitelisted environment variables to the script
+        # Note: explicit env instead of preexec_fn, as preexec_fn is not safe when tasks are run in threads
+        env = {variable: os.environ[variable] for variable in args.env_whitelist} if args.env_whitelist else None
 
         if isinstance(args.script, list):
             safe_shell_script = " ".join(args.script)
@@ -37,19 +38,28 @@ class RunScriptPlugin(PluginABC):
             safe_shell_script = args.script
 
         try:
-            result = subprocess.run(
-                safe_shell_script,
-                shell=True,
-                cwd=args.origin,
-                timeout=args.timeout,  # kill process after timeout, raise TimeoutExpired
-                check=True,  # raise CalledProcessError if return code is non-zero
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # merge stderr & stdout to single output
-                preexec_fn=set_up_env_sandbox if args.env_whitelist else None,
-            )
+            if args.max_output_size is not None:
+                stdout = self._run_keeping_output_tail(
+                    safe_shell_script,
+                    cwd=args.origin,
+                    timeout=args.timeout,
+                    env=env,
+                    max_output_size=args.max_output_size,
+                )
+            else:
+                stdout = subprocess.run(
+                    safe_shell_script,
+                    shell=True,
+                    cwd=args.origin,
+                    timeout=args.timeout,  # kill process after timeout, raise TimeoutExpired
+                    check=True,  # raise CalledProcessError if return code is non-zero
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,  # merge stderr & stdout to single output
+                    env=env,
+                ).stdout
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             output = e.output or ""
-            output = output if isinstance(output, str) else output.decode("utf-8")
+            output = output if isinstance(output, str) else output.decode("utf-8", errors="replace")
 
             if isinstance(e, subprocess.TimeoutExpired):
                 raise PluginExecutionFailed(
@@ -63,5 +73,76 @@ class RunScriptPlugin(PluginABC):
                 ) from e
 
         return PluginOutput(
-            output=result.stdout.decode("utf-8"),
+            output=stdout.decode("utf-8", errors="replace" if args.max_output_size is not None else "strict"),
         )
+
+    @classmethod
+    def _run_keeping_output_tail(
+        cls,
+        script: str,
+        *,
+        cwd: str,
+        timeout: float | None,
+        env: dict[str, str] | None,
+        max_output_size: int,
+    ) -> bytes:
+        """
+        Run shell script as `subprocess.run(..., check=True)` does, but keep only the tail of the output in memory.
+        :param script: shell script to run
+        :param cwd: working directory
+        :param timeout: kill process after timeout, None for no timeout
+        :param env: environment variables, None to inherit
+        :param max_output_size: max number of last bytes of merged stdout & stderr to keep
+        :return: last `max_output_size` bytes of the output
+        :raises subprocess.TimeoutExpired: if process timed out, with the output tail
+        :raises subprocess.CalledProcessError: if process exit code is non-zero, with the output tail
+        """
+        output_tail: deque[bytes] = deque()
+        output_tail_size = 0
+
+        def get_output() -> bytes:
+            output = b"".join(output_tail)
+            return output[-max_output_size:] if max_output_size > 0 else b""
+
+        # single deadline for both reading the output and waiting for the process,
+        # as background children of the shell may hold the output pipe after the shell exits
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def get_remaining_time() -> float | None:
+            return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+        with subprocess.Popen(
+            script,
+            shell=True,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # merge stderr & stdout to single output
+            env=env,
+        ) as process:
+            assert process.stdout is not None
+            try:
+                with selectors.DefaultSelector() as selector:
+                    selector.register(process.stdout, selectors.EVENT_READ)
+                    while True:
+                        remaining_time = get_remaining_time()
+                        if remaining_time == 0:
+                            raise subprocess.TimeoutExpired(script, timeout or 0)
+                        if not selector.select(remaining_time):
+                            continue
+                        chunk = os.read(process.stdout.fileno(), cls.OUTPUT_READ_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        output_tail.append(chunk)
+                        output_tail_size += len(chunk)
+                        # drop the oldest chunks while the rest is enough to fill the limit
+                        while len(output_tail) > 1 and output_tail_size - len(output_tail[0]) >= max_output_size:
+                            output_tail_size -= len(output_tail.popleft())
+                returncode = process.wait(timeout=get_remaining_time())
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise subprocess.TimeoutExpired(script, timeout or 0, output=get_output())
+
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, script, output=get_output())
+        return get_output()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import io
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -10,10 +13,10 @@ from .course import Course, FileSystemTask
 from .exceptions import TestingError
 from .pipeline import PipelineResult, PipelineRunner, PipelineStageResult
 from .plugins import load_plugins
-from .utils import print_header_info, print_info, print_separator
+from .utils import DATACLASS_SLOTS, print_header_info, print_info, print_separator, redirect_print_info
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GlobalPipelineVariables:
     """Base variables passed in pipeline stages."""
 
@@ -24,7 +27,7 @@ class GlobalPipelineVariables:
     task_sub_paths: list[str]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TaskPipelineVariables:
     """Variables passed in pipeline stages for each task."""
 
@@ -51,6 +54,8 @@ class Tester:
         *,
         verbose: bool = False,
         dry_run: bool = False,
+        num_processes: int = 1,
+        fail_fast: bool = False,
     ):
         """
         Init tester in specific public and private dirs.
@@ -59,6 +64,8 @@ class Tester:
         :param checker_config: Full checker config with testing,structure and params folders
         :param verbose: Whatever to print private outputs and debug info
         :param dry_run: Do not execute anything, just print what would be executed
+        :param num_processes: Max number of tasks pipelines to run in parallel, 1 to run sequentially
+        :param fail_fast: Do not start other tasks pipelines after the first failed one
         :raises exception.ValidationError: if config is invalid or repo structure is wrong
         """
         self.course = course
@@ -75,9 +82,14 @@ class Tester:
 
         self.repository_dir = self.course.repository_root
         self.reference_dir = self.course.reference_root
+        # resolve once, used in every pipeline context
+        self._repository_dir_posix = self.repository_dir.absolute().as_posix()
+        self._reference_dir_posix = self.reference_dir.absolute().as_posix()
 
         self.verbose = verbose
         self.dry_run = dry_run
+        self.num_processes = num_processes
+        self.fail_fast = fail_fast
 
     def _get_global_pipeline_parameters(
         self,
@@ -85,8 +97,8 @@ class Tester:
         tasks: list[FileSystemTask],
     ) -> GlobalPipelineVariables:
         return GlobalPipelineVariables(
-            ref_dir=self.reference_dir.absolute().as_posix(),
-            repo_dir=self.repository_dir.absolute().as_posix(),
+            ref_dir=self._reference_dir_posix,
+            repo_dir=self._repository_dir_posix,
             temp_dir=origin.absolute().as_posix(),
             task_names=[task.name for task in tasks],
             task_sub_paths=[task.relative_path for task in tasks],
@@ -113,7 +125,9 @@ class Tester:
             "global": global_variables,
             "task": task_variables,
             "outputs": outputs,
-            "parameters": default_parameters.__dict__ | (task_parameters.__dict__ if task_parameters else {}),
+            # task parameters override default ones
+            # Note: plain dict, as jinja looks up attributes first and mapping views (e.g. ChainMap) have own ones
+            "parameters": {**default_parameters.__dict__, **(task_parameters.__dict__ if task_parameters else {})},
             "env": os.environ.__dict__,
         }
 
@@ -135,12 +149,12 @@ class Tester:
             # validate task with global + task-specific params
             print_info(f"- task {task.name} pipeline...")
 
-            # create task context
+            # create task context, outputs registered by task are written to own copy of global outputs
             task_variables = self._get_task_pipeline_parameters(task)
             context = self._get_context(
                 global_variables,
                 task_variables,
-                outputs,
+                dict(outputs),
                 self.default_params,
                 task.config.parameters if task.config else None,
             )
@@ -182,43 +196,133 @@ class Tester:
             if not global_pipeline_result:
                 raise TestingError("Global pipeline failed")
 
-        failed_tasks = []
-        for task in tasks:
-            # run task pipeline
-            print_header_info(f"Run <{task.name}> task pipeline:", color="pink")
+        failed_tasks_names = set()
+        if self.num_processes > 1 and len(tasks) > 1:
+            # tasks are independent, so run them in threads (actual work is done in subprocesses)
+            # buffer each task output and print it at once to keep it readable
+            # set by the first failed task if fail_fast, not started tasks are skipped, running ones are finished
+            stop_event = threading.Event()
+            # unexpected error of a task is raised after outputs of all running tasks are printed
+            task_error: Exception | None = None
+            with ThreadPoolExecutor(max_workers=self.num_processes) as executor:
+                future_to_task = {
+                    executor.submit(self._run_task_buffered, task, global_variables, outputs, report, stop_event): task
+                    for task in tasks
+                }
+                not_handled_futures = set(future_to_task)
+
+                def handle_task_result(future: Future[tuple[bool, str] | None]) -> None:
+                    nonlocal task_error
+                    not_handled_futures.discard(future)
+                    try:
+                        task_result = future.result()
+                    except Exception as e:
+                        task_error = task_error or e
+                        return
+                    if task_result is None:
+                        return
+                    task_passed, task_output = task_result
+                    print_info(task_output, end="")
+                    if not task_passed:
+                        failed_tasks_names.add(future_to_task[future].name)
+
+                try:
+                    for future in as_completed(future_to_task):
+                        handle_task_result(future)
+                except BaseException:
+                    # e.g. KeyboardInterrupt, do not start queued tasks, but print outputs of finished ones
+                    stop_event.set()
+                    executor.shutdown(cancel_futures=True)
+                    for future in future_to_task:
+                        if future in not_handled_futures and not future.cancelled():
+                            handle_task_result(future)
+                    raise
+            if task_error is not None:
+                raise task_error
+        else:
+            for task in tasks:
+                if not self._run_task(task, global_variables, outputs, report):
+                    failed_tasks_names.add(task.name)
+                    if self.fail_fast:
+                        break
+
+        failed_tasks = [task.name for task in tasks if task.name in failed_tasks_names]
+        if failed_tasks:
+            raise TestingError(f"Task pipelines failed: {failed_tasks}")
 
-            # create task context
-            task_variables = self._get_task_pipeline_parameters(task)
-            context = self._get_context(
-                global_variables,
-                task_variables,
-                outputs,
-                self.default_params,
-                task.config.parameters if task.config else None,
-            )
+    def _run_task_buffered(
+        self,
+        task: FileSystemTask,
+        global_variables: GlobalPipelineVariables,
+        outputs: dict[str, PipelineStageResult],
+        report: bool,
+        stop_event: threading.Event,
+    ) -> tuple[bool, str] | None:
+        """
+        Run task with buffered output, to be run in a thread.
+        On unexpected error, output collected so far is printed and other tasks are not started (as sequential run).
+        :return: if task passed and its output, None if skipped because other task failed (fail_fast)
+        """
+        if stop_event.is_set():
+            return None
+        buffer = io.StringIO()
+        try:
+            with redirect_print_info(buffer):
+                task_passed = self._run_task(task, global_variables, outputs, report)
+        except BaseException:
+            stop_event.set()
+            print_info(buffer.getvalue(), end="")
+            raise
+        if not task_passed and self.fail_fast:
+            stop_event.set()
+        return task_passed, buffer.getvalue()
+
+    def _run_task(
+        self,
+        task: FileSystemTask,
+        global_variables: GlobalPipelineVariables,
+        outputs: dict[str, PipelineStageResult],
+        report: bool,
+    ) -> bool:
+        """
+        Run task pipeline and report pipeline (if task pipeline succeeded) for a single task.
+        :return: True if task pipeline succeeded
+        """
+        # run task pipeline
+        print_header_info(f"Run <{task.name}> task pipeline:", color="pink")
+
+        # create task context, outputs registered by task are written to own copy of global outputs (few ones)
+        # not to mix registered outputs of different tasks
+        # Note: plain dict, as jinja looks up attributes first and mapping views (e.g. ChainMap) have own ones
+        task_variables = self._get_task_pipeline_parameters(task)
+        context = self._get_context(
+            global_variables,
+            task_variables,
+            dict(outputs),
+            self.default_params,
+            task.config.parameters if task.config else None,
+        )
 
-            # TODO: read pipeline from task config if any
-            task_pipeline_result: PipelineResult = self.task_pipeline.run(context, dry_run=self.dry_run)
-            print_separator("-")
+        # TODO: read pipeline from task config if any
+        task_pipeline_result: PipelineResult = self.task_pipeline.run(context, dry_run=self.dry_run)
+        print_separator("-")
 
-            print_info(str(task_pipeline_result), color="pink")
-            print_separator("-")
+        print_info(str(task_pipeline_result), color="pink")
+        print_separator("-")
 
-            # Report score if task pipeline succeeded
-            if task_pipeline_result:
-                print_info(f"Reporting <{task.name}> task tests:", color="pink")
-                if report:
-                    task_report_result: PipelineResult = self.report_pipeline.run(context, dry_run=self.dry_run)
-                    if task_report_result:
-                        print_info("->Reporting succeeded")
-                    else:
-                        print_info("->Reporting failed")
-                else:
-                    _: PipelineResult = self.report_pipeline.run(context, dry_run=True)
-                    print_info("->Reporting disabled (dry-run)")
-                print_separator("-")
-            else:
-                failed_tasks.append(task.name)
+        # Report score if task pipeline succeeded
+        if not task_pipeline_result:
+            return False
 
-        if failed_tasks:
-            raise TestingError(f"Task pipelines failed: {failed_tasks}")
+        print_info(f"Reporting <{task.name}> task tests:", color="pink")
+        if report:
+            task_report_result: PipelineResult = self.report_pipeline.run(context, dry_run=self.dry_run)
+            if task_report_result:
+                print_info("->Reporting succeeded")
+            else:
+                print_info("->Reporting failed")
+        else:
+            _: PipelineResult = self.report_pipeline.run(context, dry_run=True)
+            print_info("->Reporting disabled (dry-run)")
+        print_separator("-")
+        return True
@@ -1,10 +1,48 @@
 from __future__ import annotations
 
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from inspect import cleandoc
 from typing import Any
 
 
+# `slots` argument of `dataclass` is available only from python 3.10
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# ANSI escape codes of print_info colors
+_COLORS = {
+    "white": "\033[97m",
+    "cyan": "\033[96m",
+    "pink": "\033[95m",
+    "blue": "\033[94m",
+    "orange": "\033[93m",
+    "green": "\033[92m",
+    "red": "\033[91m",
+    "grey": "\033[90m",
+}
+_COLORS_END = "\033[0m"
+
+# per-thread default output of print_info, see `redirect_print_info`
+_print_info_local = threading.local()
+
+
+@contextmanager
+def redirect_print_info(file: Any) -> Iterator[Any]:
+    """
+    Redirect print_info calls without explicit `file` made in the current thread to `file`.
+    Used to keep output of tasks running in parallel from interleaving.
+    :param file: file-like object to print to
+    """
+    previous_file = getattr(_print_info_local, "file", None)
+    _print_info_local.file = file
+    try:
+        yield file
+    finally:
+        _print_info_local.file = previous_file
+
+
 def print_ascii_tag(
     version: str | None = None,
     file: Any = None,
@@ -37,26 +75,17 @@ def print_info(
     color: str | None = None,
     **kwargs: Any,
 ) -> None:
-    colors = {
-        "white": "\033[97m",
-        "cyan": "\033[96m",
-        "pink": "\033[95m",
-        "blue": "\033[94m",
-        "orange": "\033[93m",
-        "green": "\033[92m",
-        "red": "\033[91m",
-        "grey": "\033[90m",
-        "endc": "\033[0m",
-    }
-
-    file = file or sys.stderr
+    redirected_file = getattr(_print_info_local, "file", None)
+    file = file or redirected_file or sys.stderr
 
     data = " ".join(map(str, args))
-    if color in colors:
-        print(colors[color] + data + colors["endc"], file=file, **kwargs)
+    if color in _COLORS:
+        print(_COLORS[color] + data + _COLORS_END, file=file, **kwargs)
     else:
         print(data, file=file, **kwargs)
-    file.flush()
+    # redirected output is a buffer written out at once later, so flush only real outputs
+    if file is not redirected_file:
+        file.flush()
 
 
 def print_separator(
@@ -1,8 +1,11 @@
 import inspect
+import os
 from pathlib import Path
+from typing import Any
 
 import pydantic
 import pytest
+import yaml
 
 from checker.configs.utils import CustomBaseModel, YamlLoaderMixin
 from checker.exceptions import BadConfig
@@ -46,6 +49,30 @@ class TestYamlLoader:
 
         self.SomeTestModel.from_yaml(yaml_path)
 
+    def test_load_cached_until_changed(self, tmp_path: Path, mocker: Any) -> None:
+        yaml_path = tmp_path / "test.yaml"
+        yaml_path.write_text('a: 1\nb: "123"\n')
+        load_spy = mocker.spy(yaml, "load")
+
+        model = self.SomeTestModel.from_yaml(yaml_path)
+        other_model = self.SomeTestModel.from_yaml(yaml_path)
+        assert model == other_model
+        assert model is not other_model
+        assert load_spy.call_count == 1
+
+        yaml_path.write_text('a: 22\nb: "123"\n')
+        assert self.SomeTestModel.from_yaml(yaml_path).a == 22
+        assert load_spy.call_count == 2
+
+        # replaced by file of the same size and modification time
+        new_yaml_path = tmp_path / "new.yaml"
+        new_yaml_path.write_text('a: 33\nb: "123"\n')
+        stat = yaml_path.stat()
+        os.utime(new_yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        new_yaml_path.replace(yaml_path)
+        assert self.SomeTestModel.from_yaml(yaml_path).a == 33
+        assert load_spy.call_count == 3
+
     def test_no_file_error(self, tmp_path: Path) -> None:
         yaml_path = tmp_path / "test.yaml"
 
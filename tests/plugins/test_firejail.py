@@ -37,6 +37,8 @@ class TestSafeRunScriptPlugin:
             ({"origin": "/tmp/123", "script": 123}, ValidationError),
             ({"origin": "/tmp/123", "script": ["echo", "Hello"]}, None),
             ({"origin": "/tmp/123", "script": "echo Hello", "timeout": 10}, None),
+            ({"origin": "/tmp/123", "script": "echo Hello", "max_output_size": 1024}, None),
+            ({"origin": "/tmp/123", "script": "echo Hello", "max_output_size": -1}, ValidationError),
         ],
     )
     def test_plugin_args(self, parameters: dict[str, Any], expected_exception: Exception | None) -> None:
@@ -1 +1,32 @@
-# TODO: test plugin loader
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import Any
+
+from checker.plugins import PluginABC, load_plugins
+
+
+class TestLoadPlugins:
+    def test_builtin_plugins(self) -> None:
+        plugins = load_plugins()
+        assert {"run_script", "check_regexps", "aggregate"} <= set(plugins)
+        assert all(issubclass(plugin, PluginABC) for plugin in plugins.values())
+
+    def test_loaded_once(self, tmpdir: Path, mocker: Any) -> None:
+        # new search directory, so not loaded before
+        plugins_dir = Path(tmpdir / "plugins")
+        plugins_dir.mkdir()
+        (plugins_dir / "empty_plugin_module.py").write_text("")
+        module_from_spec_spy = mocker.spy(importlib.util, "module_from_spec")
+
+        plugins = load_plugins([plugins_dir])
+        assert module_from_spec_spy.call_count > 0
+
+        module_from_spec_spy.reset_mock()
+        other_plugins = load_plugins([str(plugins_dir)])
+        module_from_spec_spy.assert_not_called()
+
+        assert plugins == other_plugins
+        # each caller gets own dict
+        assert plugins is not other_plugins
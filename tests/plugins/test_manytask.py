@@ -207,10 +207,36 @@ class TestManytaskPlugin:
                 assert result.status_code == 200
                 assert result.text == "Success"
 
+    @pytest.mark.parametrize("scheme", ["https://", "http://"])
+    def test_session_retries(self, scheme: str) -> None:
+        retries = ManytaskPlugin._get_session().get_adapter(f"{scheme}example.com").max_retries
+
+        assert retries.total == 3
+        assert retries.backoff_factor == 1
+        assert retries.backoff_jitter == 1
+        assert "POST" in retries.allowed_methods
+        assert set(retries.status_forcelist) == {408, 500, 502, 503, 504}
+        assert retries.raise_on_status is False
+        assert retries.is_retry("POST", 503)
+        assert not retries.is_retry("POST", 400)
+
+    def test_post_with_retries_reuses_session(self) -> None:
+        with Mocker() as mocker:
+            mocker.post(f"{self.BASE_URL}api/report", status_code=200, text="Success")
+
+            ManytaskPlugin._post_with_retries(self.BASE_URL, {"key": "value"}, None)
+            session = ManytaskPlugin._session
+            ManytaskPlugin._post_with_retries(self.BASE_URL, {"key": "value"}, None)
+
+        assert session is not None
+        assert ManytaskPlugin._session is session
+        assert mocker.call_count == 2
+
     def test_plugin_run(self, mocker: MockFixture) -> None:
         args_dict = self.get_default_full_args_dict()
         result_score = 1.0
-        expected_files = {"files": "good"}
+        file = mocker.MagicMock()
+        expected_files = {"file.py": ("file.py", file)}
         expected_data = {
             "token": self.REPORT_TOKEN,
             "task": self.TEST_TASK_NAME,
@@ -236,10 +262,11 @@ class TestManytaskPlugin:
         ManytaskPlugin._post_with_retries.assert_called_once_with(
             self.BASE_URL, expected_data, expected_files
         )  # type: ignore[attr-defined]
+        file.close.assert_called_once()
 
     def test_verbose(self, mocker: MockFixture) -> None:
         args_dict = self.get_default_full_args_dict()
-        expected_files = {"files": "good"}
+        expected_files = {"file.py": ("file.py", mocker.MagicMock())}
         result_score = 1.0
 
         mocker.patch.object(ManytaskPlugin, "_collect_files_to_send")
@@ -43,6 +43,10 @@ class TestCheckRegexpsPlugin:
                 {"origin": "/tmp/123", "patterns": None, "regexps": None},
                 ValidationError,
             ),
+            (
+                {"origin": "/tmp/123", "patterns": ["*"], "regexps": ["error", "(unclosed"]},
+                ValidationError,
+            ),
         ],
     )
     def test_plugin_args(self, parameters: dict[str, Any], expected_exception: Exception | None) -> None:
@@ -133,3 +137,61 @@ class TestCheckRegexpsPlugin:
         with pytest.raises(PluginExecutionFailed) as exc_info:
             plugin._run(args)
         assert "does not exist" in str(exc_info.value)
+
+    def test_empty_regexps(self, create_test_files: T_CREATE_TEST_FILES, mocker: Any) -> None:
+        origin = create_test_files({"test1.txt": "This is a test file with forbidden content"})
+        glob_spy = mocker.spy(Path, "glob")
+
+        plugin = CheckRegexpsPlugin()
+        args = CheckRegexpsPlugin.Args(origin=str(origin), patterns=["*"], regexps=[])
+
+        assert plugin._run(args).output == "No forbidden regexps to check"
+        glob_spy.assert_not_called()
+
+    def test_file_matched_by_several_patterns_checked_once(
+        self, create_test_files: T_CREATE_TEST_FILES, mocker: Any
+    ) -> None:
+        origin = create_test_files({"test1.txt": "This file is safe", "test2.py": "This file is safe too"})
+        find_spy = mocker.spy(CheckRegexpsPlugin, "_find_matched_regexp")
+
+        plugin = CheckRegexpsPlugin()
+        args = CheckRegexpsPlugin.Args(origin=str(origin), patterns=["*", "*.txt", "test1.*"], regexps=["forbidden"])
+
+        assert plugin._run(args).output == "No forbidden regexps found"
+        assert find_spy.call_count == 2
+
+    def test_first_matched_file_reported(self, create_test_files: T_CREATE_TEST_FILES) -> None:
+        files_content = {f"test{i:02}.txt": "This file is safe" for i in range(20)}
+        files_content.update({"test05.txt": "forbidden", "test15.txt": "forbidden"})
+        origin = create_test_files(files_content)
+
+        plugin = CheckRegexpsPlugin()
+        args = CheckRegexpsPlugin.Args(origin=str(origin), patterns=["test05.txt", "*.txt"], regexps=["forbidden"])
+
+        with pytest.raises(PluginExecutionFailed) as exc_info:
+            plugin._run(args)
+        assert "test05.txt" in str(exc_info.value)
+
+    @pytest.mark.parametrize(
+        "content, regexps, expected_regexp",
+        [
+            (b"import os\nos.system('ls')", ["import sys"], None),
+            (b"import os\nos.system('ls')", ["import sys", "import os"], "import os"),
+            (b"import os\nos.system('ls')", [r"os\.system\("], r"os\.system\("),
+            (b"import os\nos.system('ls')", ["^os", "import os"], "^os"),
+            (b"import os\nos.system('ls')", ["^system", "import  os"], None),
+            (b"a + b", ["a + b"], None),
+            (b"a + b", [r"a \+ b"], r"a \+ b"),
+            (b"", ["forbidden", "fo.*en"], None),
+            ("print('привет')".encode(), ["привет"], "привет"),
+            ("print('привет')".encode(), [r"\w+т'"], r"\w+т'"),
+            (b"int x;\r\nint y;\r\n", [r"x;$"], r"x;$"),
+            (b"int x;\r\nint y;\r\n", ["x;\ni"], "x;\ni"),
+        ],
+    )
+    def test_find_matched_regexp(
+        self, tmp_path: Path, content: bytes, regexps: list[str], expected_regexp: str | None
+    ) -> None:
+        file = tmp_path / "file"
+        file.write_bytes(content)
+        assert CheckRegexpsPlugin._find_matched_regexp(file, regexps) == expected_regexp
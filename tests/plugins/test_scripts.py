@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Any
 from unittest.mock import patch
 
@@ -33,6 +34,9 @@ class TestRunScriptPlugin:
                 },
                 None,
             ),
+            ({"origin": "/tmp", "script": "echo Hello", "max_output_size": 1024}, None),
+            ({"origin": "/tmp", "script": "echo Hello", "max_output_size": "many"}, ValidationError),
+            ({"origin": "/tmp", "script": "echo Hello", "max_output_size": -1}, ValidationError),
         ],
     )
     def test_plugin_args(self, parameters: dict[str, Any], expected_exception: Exception | None) -> None:
@@ -67,6 +71,31 @@ class TestRunScriptPlugin:
             result = plugin._run(args)
             assert result.output.strip() == output
 
+    @pytest.mark.parametrize(
+        "script, max_output_size, output, expected_exception",
+        [
+            ("echo Hello", 1024, "Hello\n", None),
+            ("echo Hello", 3, "lo\n", None),
+            ("echo Hello", 0, "", None),
+            ("for i in $(seq 1 10000); do echo line$i; done", 9, "line9999\nline10000\n"[-9:], None),
+            ("for i in $(seq 1 10000); do echo line$i; done && false", 10, "line10000\n", PluginExecutionFailed),
+            ("echo Hello && sleep 1", 1024, "Hello\n", PluginExecutionFailed),
+        ],
+    )
+    def test_max_output_size(
+        self, script: str, max_output_size: int, output: str, expected_exception: Exception | None
+    ) -> None:
+        plugin = RunScriptPlugin()
+        args = RunScriptPlugin.Args(origin="/tmp", script=script, timeout=0.5, max_output_size=max_output_size)
+
+        if expected_exception:
+            with pytest.raises(expected_exception) as exc_info:
+                plugin._run(args)
+            assert exc_info.value.output == output
+        else:
+            result = plugin._run(args)
+            assert result.output == output
+
     @pytest.mark.parametrize(
         "script, timeout, expected_exception",
         [
@@ -87,6 +116,20 @@ class TestRunScriptPlugin:
         else:
             plugin._run(args)
 
+    @pytest.mark.parametrize("max_output_size", [None, 1000])
+    def test_timeout_with_background_child(self, max_output_size: int | None) -> None:
+        # shell exits at once, but its background child holds the output pipe
+        plugin = RunScriptPlugin()
+        args = RunScriptPlugin.Args(
+            origin="/tmp", script="sleep 3 & echo hi", timeout=0.5, max_output_size=max_output_size
+        )
+
+        start_time = time.monotonic()
+        with pytest.raises(PluginExecutionFailed) as exc_info:
+            plugin._run(args)
+        assert time.monotonic() - start_time < 2
+        assert "timed out" in exc_info.value.message
+
     @pytest.mark.parametrize(
         "script, env_whitelist, mocked_env",
         [
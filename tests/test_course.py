@@ -138,6 +138,16 @@ class TestCourse:
             assert isinstance(group, FileSystemGroup)
             assert (repository_root / group.relative_path).exists()
 
+    def test_search_for_groups_by_configs_with_found_tasks(self, repository_root: Path) -> None:
+        tasks = list(Course._search_for_tasks_by_configs(repository_root))
+        potential_groups = list(Course._search_for_groups_by_configs(repository_root, tasks))
+        expected_groups = list(Course._search_for_groups_by_configs(repository_root))
+        assert [group.name for group in potential_groups] == [group.name for group in expected_groups]
+        for group, expected_group in zip(potential_groups, expected_groups):
+            assert [task.relative_path for task in group.tasks] == [task.relative_path for task in expected_group.tasks]
+            # reuse already found tasks
+            assert all(any(task is found_task for found_task in tasks) for task in group.tasks)
+
     def test_search_for_tasks_by_configs(self, repository_root: Path) -> None:
         tasks = list(Course._search_for_tasks_by_configs(repository_root))
         assert len(tasks) == 7
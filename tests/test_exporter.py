@@ -8,7 +8,7 @@ import pytest
 from checker.configs import CheckerExportConfig, CheckerStructureConfig, ManytaskConfig
 from checker.course import Course
 from checker.exceptions import BadStructure
-from checker.exporter import Exporter
+from checker.exporter import Exporter, _match_any_pattern
 
 from .conftest import T_GENERATE_FILE_STRUCTURE
 
@@ -132,6 +132,50 @@ class TestExporterOnSimple:
     def test_simple_validate_ok(self, tmpdir: Path, simple_exporter: Exporter) -> None:
         simple_exporter.validate()
 
+    def test_temporary_dir_root(
+        self,
+        tmpdir: Path,
+        simple_exporter: Exporter,
+        simple_structure: CheckerStructureConfig,
+        simple_export_config: CheckerExportConfig,
+    ) -> None:
+        temporary_dir_root = Path(tmpdir / "scratch" / "root")
+        exporter = Exporter(
+            simple_exporter.course,
+            simple_structure,
+            simple_export_config,
+            temporary_dir_root=temporary_dir_root,
+        )
+        other_exporter = Exporter(
+            simple_exporter.course,
+            simple_structure,
+            simple_export_config,
+            temporary_dir_root=temporary_dir_root,
+        )
+        assert exporter.temporary_dir.parent == temporary_dir_root
+        assert exporter.temporary_dir.exists()
+        assert exporter.temporary_dir != other_exporter.temporary_dir
+
+    @pytest.mark.parametrize("cleanup", [True, False])
+    def test_temporary_dir_cleanup(
+        self,
+        tmpdir: Path,
+        simple_exporter: Exporter,
+        simple_structure: CheckerStructureConfig,
+        simple_export_config: CheckerExportConfig,
+        cleanup: bool,
+    ) -> None:
+        with Exporter(
+            simple_exporter.course,
+            simple_structure,
+            simple_export_config,
+            cleanup=cleanup,
+            temporary_dir_root=Path(tmpdir / "scratch"),
+        ) as exporter:
+            exporter.export_for_testing(exporter.temporary_dir)
+            assert any(exporter.temporary_dir.iterdir())
+        assert exporter.temporary_dir.exists() is not cleanup
+
     def test_simple_validate_mix_templates_in_task(
         self, tmpdir: Path, simple_exporter: Exporter, simple_private_folder: Path, simple_export_folder: Path
     ) -> None:
@@ -313,6 +357,50 @@ class TestExporterOnSimple:
         excluded_paths = simple_exporter._search_for_exclude_due_to_templates(Path(tmpdir / "test_data"), False)
         assert sorted(excluded_paths) == sorted(expected_excluded_paths)
 
+    @pytest.mark.parametrize(
+        "path",
+        ["file.py", "folder/file.pyc", "/abs/folder/.git", "a/b/c/d.txt", "__pycache__", "folder/FILE.PY", "a/b"],
+    )
+    @pytest.mark.parametrize(
+        "patterns",
+        [["*.py"], ["*.pyc", ".git", "__pycache__"], ["b/*.txt", "*.md"], ["c/*"], ["a/b/*/*", "**", "d.*"], []],
+    )
+    def test_match_any_pattern(self, path: str, patterns: list[str]) -> None:
+        assert _match_any_pattern(Path(path), patterns) == any(Path(path).match(pattern) for pattern in patterns)
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (b"", False),
+            (b"int main() { return 0; }", False),
+            (b"// SOLUTION BEGIN\nreturn 0;\n", False),
+            (b"// SOLUTION BEGIN\nreturn 0;\n// SOLUTION END\n", True),
+            (bytes(range(256)) + b"SOLUTION BEGIN SOLUTION END", True),
+        ],
+    )
+    def test_has_template_comments(self, tmpdir: Path, content: bytes, expected: bool) -> None:
+        path = Path(tmpdir / "file")
+        path.write_bytes(content)
+
+        assert Exporter._has_template_comments(path) == expected
+
+    @pytest.mark.parametrize(
+        "copy_file_range_mock",
+        [None, {"side_effect": OSError(18, "Invalid cross-device link")}, {"return_value": 0}],
+    )
+    @pytest.mark.parametrize("content", [b"", b"some text\n", bytes(range(256)) * 1024])
+    def test_copy_file(
+        self, tmpdir: Path, mocker: Any, content: bytes, copy_file_range_mock: dict[str, Any] | None
+    ) -> None:
+        source, destination = Path(tmpdir / "source"), Path(tmpdir / "destination")
+        source.write_bytes(content)
+        destination.write_bytes(b"old content to overwrite")
+        if copy_file_range_mock:
+            mocker.patch("os.copy_file_range", create=True, **copy_file_range_mock)
+
+        Exporter._copy_file(source, destination)
+        assert destination.read_bytes() == content
+
     @pytest.mark.parametrize(
         "copy_public, copy_private, copy_other, expected_files",
         [
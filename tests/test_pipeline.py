@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Type
+from typing import Any, Type
 
 import pytest
 
@@ -335,3 +335,44 @@ class TestPipelineRunnerValidation:
         # stages names are printed
         for stage_name in ["stage1", "stage2", "stage3"]:
             assert stage_name in captured
+
+    def test_plugins_instantiated_once(
+        self,
+        sample_correct_pipeline: list[PipelineStageConfig],
+        sample_plugins: dict[str, Type[PluginABC]],
+    ) -> None:
+        pipeline_runner = PipelineRunner(
+            pipeline=sample_correct_pipeline,
+            plugins=sample_plugins,
+            verbose=False,
+        )
+        plugin_instances = dict(pipeline_runner._plugin_instances)
+        assert set(plugin_instances) == {"echo", "score", "fail"}
+
+        assert not pipeline_runner.run({"message": "Hello"}).failed
+        assert not pipeline_runner.run({"message": "Hello again"}).failed
+        for name, plugin in plugin_instances.items():
+            assert pipeline_runner._plugin_instances[name] is plugin
+
+    def test_same_args_validated_once(
+        self,
+        sample_correct_pipeline: list[PipelineStageConfig],
+        sample_plugins: dict[str, Type[PluginABC]],
+        mocker: Any,
+    ) -> None:
+        pipeline_runner = PipelineRunner(
+            pipeline=sample_correct_pipeline,
+            plugins=sample_plugins,
+            verbose=False,
+        )
+        validate_spy = mocker.spy(_EchoPlugin, "validate")
+
+        pipeline_runner.validate({"message": "Hello"}, validate_placeholders=True)
+        # stage1, stage5 and stage7 echo different messages
+        assert validate_spy.call_count == 3
+
+        pipeline_runner.validate({"message": "Hello"}, validate_placeholders=True)
+        assert validate_spy.call_count == 3
+
+        pipeline_runner.validate({"message": "Hello again"}, validate_placeholders=True)
+        assert validate_spy.call_count == 4
@@ -86,6 +86,13 @@ class TestParametersResolver:
         resolver = ParametersResolver()
         assert resolver.resolve(template, context) == expected
 
+    def test_compiled_template_reused(self) -> None:
+        resolver = ParametersResolver()
+        assert resolver.resolve("${{ a }}", {"a": 1}) == 1
+        assert resolver.resolve("${{ a }}", {"a": 2}) == 2
+        assert resolver.resolve(["${{ a }}", "${{ a }}"], {"a": 3}) == [3, 3]
+        assert len(resolver._compiled_templates) == 1
+
     @pytest.mark.parametrize(
         "template, context",
         [
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockFixture
+
+from checker.configs import CheckerConfig
+from checker.configs.checker import CheckerParametersConfig, CheckerSubConfig
+from checker.course import FileSystemTask
+from checker.exceptions import TestingError
+from checker.pipeline import ParametersResolver, PipelineResult, PipelineStageResult
+from checker.tester import Tester
+from checker.utils import print_info
+
+
+TASKS_NAMES = ["task1", "task2", "task3", "task4"]
+
+
+@pytest.fixture
+def tasks() -> list[FileSystemTask]:
+    return [FileSystemTask(name, name, CheckerSubConfig.default()) for name in TASKS_NAMES]
+
+
+def create_tester(mocker: MockFixture, tmp_path: Path, **kwargs: Any) -> Tester:
+    course = mocker.MagicMock(repository_root=tmp_path, reference_root=tmp_path)
+    checker_config = CheckerConfig(
+        version=1,
+        structure={},
+        export={"destination": "https://example.com"},
+        testing={},
+    )
+    return Tester(course, checker_config, **kwargs)
+
+
+def mock_run_task(mocker: MockFixture, failed_tasks: set[str], raising_tasks: frozenset[str] = frozenset()) -> Any:
+    def _run_task(task: FileSystemTask, *args: Any) -> bool:
+        # failing tasks finish first, not to race with other tasks for the next one
+        is_failing = task.name in failed_tasks or task.name in raising_tasks
+        for i in range(3):
+            print_info(f"{task.name} line {i}")
+            time.sleep(0.001 if is_failing else 0.05)
+        if task.name in raising_tasks:
+            raise KeyError(task.name)
+        return task.name not in failed_tasks
+
+    return mocker.patch.object(Tester, "_run_task", side_effect=_run_task)
+
+
+class TestTesterRun:
+    @pytest.mark.parametrize("num_processes", [1, 4])
+    def test_output_grouped_by_task(
+        self,
+        tmp_path: Path,
+        mocker: MockFixture,
+        capsys: pytest.CaptureFixture[str],
+        tasks: list[FileSystemTask],
+        num_processes: int,
+    ) -> None:
+        tester = create_tester(mocker, tmp_path, num_processes=num_processes)
+        mock_run_task(mocker, failed_tasks=set())
+        capsys.readouterr()
+
+        tester.run(tmp_path, tasks, report=False)
+
+        lines = capsys.readouterr().err.splitlines()
+        assert sorted(lines) == sorted(f"{name} line {i}" for name in TASKS_NAMES for i in range(3))
+        for name in TASKS_NAMES:
+            first_line = lines.index(f"{name} line 0")
+            assert lines[first_line : first_line + 3] == [f"{name} line {i}" for i in range(3)]
+
+    @pytest.mark.parametrize("num_processes", [1, 4])
+    def test_failed_tasks_listed(
+        self, tmp_path: Path, mocker: MockFixture, tasks: list[FileSystemTask], num_processes: int
+    ) -> None:
+        tester = create_tester(mocker, tmp_path, num_processes=num_processes)
+        run_task_mock = mock_run_task(mocker, failed_tasks={"task4", "task2"})
+
+        with pytest.raises(TestingError) as exc_info:
+            tester.run(tmp_path, tasks, report=False)
+        assert str(["task2", "task4"]) in str(exc_info.value)
+        assert run_task_mock.call_count == len(TASKS_NAMES)
+
+    @pytest.mark.parametrize("num_processes", [1, 2])
+    def test_fail_fast_skips_not_started_tasks(
+        self, tmp_path: Path, mocker: MockFixture, tasks: list[FileSystemTask], num_processes: int
+    ) -> None:
+        tester = create_tester(mocker, tmp_path, num_processes=num_processes, fail_fast=True)
+        run_task_mock = mock_run_task(mocker, failed_tasks={"task1"})
+
+        with pytest.raises(TestingError) as exc_info:
+            tester.run(tmp_path, tasks, report=False)
+        assert str(["task1"]) in str(exc_info.value)
+        # running tasks are finished, but not started ones are skipped
+        started_tasks_names = [call.args[0].name for call in run_task_mock.call_args_list]
+        assert started_tasks_names == TASKS_NAMES[:num_processes]
+
+    def test_task_error_keeps_outputs(
+        self,
+        tmp_path: Path,
+        mocker: MockFixture,
+        capsys: pytest.CaptureFixture[str],
+        tasks: list[FileSystemTask],
+    ) -> None:
+        tester = create_tester(mocker, tmp_path, num_processes=2)
+        run_task_mock = mock_run_task(mocker, failed_tasks=set(), raising_tasks=frozenset({"task1"}))
+        capsys.readouterr()
+
+        with pytest.raises(KeyError):
+            tester.run(tmp_path, tasks, report=False)
+
+        # output of failed and running tasks is printed, not started ones are skipped as in sequential run
+        lines = capsys.readouterr().err.splitlines()
+        assert lines == [f"{name} line {i}" for name in ["task1", "task2"] for i in range(3)]
+        assert run_task_mock.call_count == 2
+
+    def test_interrupt_skips_not_started_tasks(
+        self,
+        tmp_path: Path,
+        mocker: MockFixture,
+        capsys: pytest.CaptureFixture[str],
+        tasks: list[FileSystemTask],
+    ) -> None:
+        tester = create_tester(mocker, tmp_path, num_processes=2)
+        run_task_mock = mock_run_task(mocker, failed_tasks=set())
+        capsys.readouterr()
+
+        def interrupted_as_completed(futures: Any) -> Any:
+            # interrupt (e.g. ctrl+c) while first tasks are running
+            while run_task_mock.call_count < 2:
+                time.sleep(0.001)
+            raise KeyboardInterrupt
+            yield
+
+        mocker.patch("checker.tester.as_completed", side_effect=interrupted_as_completed)
+
+        with pytest.raises(KeyboardInterrupt):
+            tester.run(tmp_path, tasks, report=False)
+
+        # running tasks are finished and printed, not started ones are skipped
+        started_tasks_names = [call.args[0].name for call in run_task_mock.call_args_list]
+        assert started_tasks_names == ["task1", "task2"]
+        lines = capsys.readouterr().err.splitlines()
+        assert lines == [f"{name} line {i}" for name in ["task1", "task2"] for i in range(3)]
+
+
+class TestTesterContext:
+    def test_parameters_named_as_mapping_attributes(self, tmp_path: Path, mocker: MockFixture) -> None:
+        tester = create_tester(mocker, tmp_path)
+        context = tester._get_context(
+            tester._get_global_pipeline_parameters(tmp_path, []),
+            None,
+            {},
+            CheckerParametersConfig({"parents": 5, "maps": 1, "get": 1}),
+            CheckerParametersConfig({"maps": 2}),
+        )
+
+        resolver = ParametersResolver()
+        assert resolver.resolve("${{ parameters.parents }}", context) == 5
+        assert resolver.resolve("${{ parameters.maps }}", context) == 2
+        assert resolver.resolve("${{ parameters }}", context) == {"parents": 5, "maps": 2, "get": 1}
+
+    def test_task_outputs_named_as_mapping_attributes(
+        self, tmp_path: Path, mocker: MockFixture, tasks: list[FileSystemTask]
+    ) -> None:
+        tester = create_tester(mocker, tmp_path)
+        outputs = {"parents": PipelineStageResult(name="global stage", failed=False, skipped=False)}
+        contexts: list[dict[str, Any]] = []
+
+        def run_task_pipeline(context: dict[str, Any], dry_run: bool = False) -> PipelineResult:
+            contexts.append(context)
+            context["outputs"]["maps"] = PipelineStageResult(name="task stage", failed=False, skipped=False)
+            return PipelineResult(failed=True, stage_results=[])
+
+        mocker.patch.object(tester.task_pipeline, "run", side_effect=run_task_pipeline)
+        tester._run_task(tasks[0], tester._get_global_pipeline_parameters(tmp_path, tasks), outputs, report=False)
+
+        resolver = ParametersResolver()
+        assert resolver.resolve("${{ outputs.parents.name }}", contexts[0]) == "global stage"
+        assert resolver.resolve("${{ outputs.maps.name }}", contexts[0]) == "task stage"
+        # outputs registered by task are not visible for other tasks
+        assert list(outputs) == ["parents"]
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import io
+import threading
+
 import pytest
 
-from checker.utils import print_ascii_tag, print_header_info, print_info, print_separator
+from checker.utils import print_ascii_tag, print_header_info, print_info, print_separator, redirect_print_info
 
 
 class TestPrint:
@@ -33,3 +36,34 @@ class TestPrint:
         captured = capsys.readouterr()
         assert "123" in captured.err
         assert "++++++++++" in captured.err
+
+    def test_redirect_print_info(self, capsys: pytest.CaptureFixture):
+        buffer = io.StringIO()
+        with redirect_print_info(buffer):
+            print_info("123")
+            print_info("456", color="green")
+        print_info("789")
+
+        captured = capsys.readouterr()
+        assert captured.err == "789\n"
+        assert "123\n" in buffer.getvalue()
+        assert "456" in buffer.getvalue()
+
+    def test_redirect_print_info_not_flushed(self) -> None:
+        buffer = io.StringIO()
+        buffer.flush = lambda: pytest.fail("redirected output flushed")  # type: ignore[method-assign]
+        with redirect_print_info(buffer):
+            print_info("123")
+
+        assert buffer.getvalue() == "123\n"
+
+    def test_redirect_print_info_thread_local(self, capsys: pytest.CaptureFixture):
+        buffer = io.StringIO()
+        with redirect_print_info(buffer):
+            thread = threading.Thread(target=print_info, args=("from thread",))
+            thread.start()
+            thread.join()
+
+        captured = capsys.readouterr()
+        assert captured.err == "from thread\n"
+        assert buffer.getvalue() == ""